@@ -0,0 +1,29 @@
+"""
+Kaori Protocol — Demo Bootstrap
+
+Makes the in-repo packages importable when the demos are run directly
+from a checkout.
+
+If kaori-flow / kaori-truth are already installed (`pip install -e`),
+nothing is added to sys.path and imports resolve normally. Otherwise
+the package `src` dirs are prepended once, however many demo modules
+import this.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent.parent
+
+_PACKAGES = {
+    "kaori_flow": ROOT_DIR / "packages" / "kaori-flow" / "src",
+    "kaori_truth": ROOT_DIR / "packages" / "kaori-truth" / "src",
+}
+
+_missing = [
+    str(src) for name, src in _PACKAGES.items()
+    if importlib.util.find_spec(name) is None
+]
+if _missing:
+    sys.path[:0] = _missing
+    importlib.invalidate_caches()
@@ -0,0 +1,101 @@
+"""
+Kaori Protocol — Shared Demo Preloader
+
+Loads and compiles FlowPolicy -> TrustPhysics through
+kaori_flow.policy_cache, the single cached loading path.
+
+The demos construct a fresh FlowCore per run (it holds the signal store),
+but TrustPhysics is frozen and hashed, so it is safe to share. Repeated
+runs in one interpreter reuse the cached physics (keyed on the policy
+file's content) instead of re-parsing YAML and recompiling the policy.
+Across processes the parsed policy is kept as a JSON cache in
+KAORI_CACHE_DIR (default ~/.cache/kaori), outside the source tree.
+
+Set KAORI_REPEAT=N to run a demo's main() N times in one process and
+report steady-state timings (min/median/p99) to stderr. Set KAORI_QUIET=1
+to silence the demos' console output (see log()).
+
+Import this module only after `_bootstrap` (or with the packages installed).
+"""
+import codecs
+import math
+import os
+import statistics
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Tuple
+
+from _bootstrap import ROOT_DIR
+from kaori_flow.flow_policy import FlowPolicy, TrustPhysics
+from kaori_flow.policy_cache import load_physics_cached
+
+# Benchmark mode: KAORI_QUIET=1 suppresses all console output
+QUIET = os.environ.get("KAORI_QUIET") == "1"
+
+# Force UTF-8 only where the console isn't already (e.g. Windows);
+# reconfigure() flushes and rebuilds the stream, so skip it otherwise
+if not QUIET and codecs.lookup(sys.stdout.encoding or 'ascii').name != 'utf-8':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# Path to versioned constitutional policy
+POLICY_PATH = ROOT_DIR / "packages" / "kaori-flow" / "policies" / "flow_policy_v1.0.0.yaml"
+
+# Where the parsed-policy JSON cache is kept (never the package tree)
+CACHE_DIR = Path(os.environ.get("KAORI_CACHE_DIR") or Path.home() / ".cache" / "kaori")
+
+
+def preload() -> TrustPhysics:
+    """
+    Load the constitutional policy and compile it to physics (cached).
+
+    The physics carries the authored policy version (`physics.version`).
+    Hard fails if the policy YAML is missing (no fallback).
+    """
+    if not POLICY_PATH.exists():
+        raise FileNotFoundError(f"Missing constitutional policy: {POLICY_PATH}")
+
+    return load_physics_cached(POLICY_PATH, cache_dir=CACHE_DIR)
+
+
+@lru_cache(maxsize=1)
+def preload_default() -> Tuple[FlowPolicy, TrustPhysics]:
+    """Build the default development policy and compile it to physics (cached)."""
+    policy = FlowPolicy.default()
+    return policy, policy.compile()
+
+
+def log(*args, **kwargs) -> None:
+    """Print unless running in quiet (benchmark) mode."""
+    if not QUIET:
+        print(*args, **kwargs)
+
+
+def run(main: Callable[[], None]) -> None:
+    """
+    Run a demo entry point, repeating it KAORI_REPEAT times (default 1).
+
+    With more than one iteration, per-iteration wall-clock timings are
+    written to stderr so import cost is excluded from the measurement.
+    """
+    repeat = int(os.environ.get("KAORI_REPEAT", "1"))
+    if repeat <= 1:
+        main()
+        return
+
+    samples_ns = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        main()
+        samples_ns.append(time.perf_counter_ns() - start)
+
+    samples_ns.sort()
+    p99 = samples_ns[math.ceil(0.99 * len(samples_ns)) - 1]
+    print(
+        f"[bench] n={repeat} "
+        f"min={samples_ns[0] / 1e6:.3f}ms "
+        f"median={statistics.median(samples_ns) / 1e6:.3f}ms "
+        f"p99={p99 / 1e6:.3f}ms",
+        file=sys.stderr,
+    )
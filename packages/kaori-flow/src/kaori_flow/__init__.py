@@ -30,6 +30,7 @@ Example:
 """
 from .core import FlowCore
 from .flow_policy import FlowPolicy
+from .policy_cache import load_policy_cached, load_physics_cached, clear_policy_cache
 from .primitives.agent import Agent, AgentType, create_agent_id, STANDING_MIN, STANDING_MAX
 from .primitives.signal import Signal, SignalContext, SignalTypes
 from .reducer import FlowReducer, ReducerState
@@ -59,6 +60,11 @@ __all__ = [
     "InMemorySignalStore",
     "JSONLSignalStore",
     
+    # Policy cache
+    "load_policy_cached",
+    "load_physics_cached",
+    "clear_policy_cache",
+    
     # Reducer
     "FlowReducer",
     "ReducerState",
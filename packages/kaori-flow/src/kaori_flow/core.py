@@ -25,6 +25,7 @@ class FlowCore:
     
     Public API:
         - emit(signal): Append signal to store
+        - emit_many(signals): Append a batch of signals in one store write
         - get_standing(agent_id): Get current standing for agent
         - get_trust_snapshot(agent_ids, context): Compute trust snapshot
     
@@ -100,6 +101,16 @@ class FlowCore:
         self.store.append(signal)
         self._cache_valid = False  # Invalidate cache
     
+    def emit_many(self, signals: List[Signal]) -> None:
+        """
+        Emit a batch of signals with one store write.
+        
+        Equivalent to emit() per signal, but the store is written once and
+        the standings cache is invalidated once.
+        """
+        self.store.extend(signals)
+        self._cache_valid = False  # Invalidate cache
+    
     def get_standing(self, agent_id: str) -> float:
         """
         Get current standing for an agent.
@@ -210,23 +221,34 @@ class FlowCore:
         claimtype_id: Optional[str] = None,
     ) -> Signal:
         """Emit OBSERVATION_SUBMITTED signal."""
-        from .primitives.signal import SignalContext
-        
-        signal = Signal(
-            signal_type=SignalTypes.OBSERVATION_SUBMITTED,
-            time=datetime.now(timezone.utc),
-            agent_id=observer_id,
-            object_id=probe_id,
-            context=SignalContext(
-                probe_id=probe_id,
-                claimtype_id=claimtype_id,
-            ) if claimtype_id else None,
+        signal = self._observation_signal(
+            datetime.now(timezone.utc),
+            observer_id=observer_id,
+            probe_id=probe_id,
             payload=payload,
-            policy_version=self.policy.version,
+            claimtype_id=claimtype_id,
         )
         self.emit(signal)
         return signal
     
+    def submit_observations(self, observations: List[dict]) -> List[Signal]:
+        """
+        Emit OBSERVATION_SUBMITTED signals for a batch of observations.
+        
+        Each item takes the submit_observation() keyword arguments
+        (observer_id, probe_id, payload, optional claimtype_id). The batch
+        shares one timestamp and is written to the store once; each signal
+        carries its batch_index, so identical items stay distinct signals,
+        as with per-item calls.
+        """
+        now = datetime.now(timezone.utc)
+        signals = [
+            self._observation_signal(now, batch_index=i, **obs)
+            for i, obs in enumerate(observations)
+        ]
+        self.emit_many(signals)
+        return signals
+    
     def emit_truthstate(
         self,
         truthkey: str,
@@ -241,24 +263,35 @@ class FlowCore:
         
         This updates standings for contributors based on outcome.
         """
-        signal = Signal(
-            signal_type=SignalTypes.TRUTHSTATE_EMITTED,
-            time=datetime.now(timezone.utc),
-            agent_id="system:truth",
-            object_id=truthkey,
-            payload={
-                "status": status,
-                "confidence": confidence,
-                "contributors": contributors,
-                "outcome": outcome,
-                "quality_score": quality_score,
-                "policy_agent_id": self.policy.policy_id,
-            },
-            policy_version=self.policy.version,
+        signal = self._truthstate_signal(
+            datetime.now(timezone.utc),
+            truthkey=truthkey,
+            status=status,
+            confidence=confidence,
+            contributors=contributors,
+            outcome=outcome,
+            quality_score=quality_score,
         )
         self.emit(signal)
         return signal
     
+    def emit_truthstates(self, truthstates: List[dict]) -> List[Signal]:
+        """
+        Emit TRUTHSTATE_EMITTED signals for a batch of truth states.
+        
+        Each item takes the emit_truthstate() keyword arguments. The batch
+        shares one timestamp and is written to the store once; each signal
+        carries its batch_index, so identical items stay distinct signals.
+        Standings are reduced once on the next read, in batch order.
+        """
+        now = datetime.now(timezone.utc)
+        signals = [
+            self._truthstate_signal(now, batch_index=i, **ts)
+            for i, ts in enumerate(truthstates)
+        ]
+        self.emit_many(signals)
+        return signals
+    
     def endorse(self, endorser_id: str, endorsed_id: str) -> Signal:
         """
         Emit ENDORSEMENT signal (creates VOUCH edge).
@@ -278,6 +311,61 @@ class FlowCore:
     # Internal Methods
     # =========================================================================
     
+    def _observation_signal(
+        self,
+        time: datetime,
+        observer_id: str,
+        probe_id: str,
+        payload: dict,
+        claimtype_id: Optional[str] = None,
+        batch_index: Optional[int] = None,
+    ) -> Signal:
+        """Build an OBSERVATION_SUBMITTED signal."""
+        from .primitives.signal import SignalContext
+        
+        return Signal(
+            signal_type=SignalTypes.OBSERVATION_SUBMITTED,
+            time=time,
+            agent_id=observer_id,
+            object_id=probe_id,
+            context=SignalContext(
+                probe_id=probe_id,
+                claimtype_id=claimtype_id,
+            ) if claimtype_id else None,
+            payload=payload,
+            policy_version=self.policy.version,
+            batch_index=batch_index,
+        )
+    
+    def _truthstate_signal(
+        self,
+        time: datetime,
+        truthkey: str,
+        status: str,
+        confidence: float,
+        contributors: List[str],
+        outcome: str = "correct",
+        quality_score: float = 50.0,
+        batch_index: Optional[int] = None,
+    ) -> Signal:
+        """Build a TRUTHSTATE_EMITTED signal."""
+        return Signal(
+            signal_type=SignalTypes.TRUTHSTATE_EMITTED,
+            time=time,
+            agent_id="system:truth",
+            object_id=truthkey,
+            payload={
+                "status": status,
+                "confidence": confidence,
+                "contributors": contributors,
+                "outcome": outcome,
+                "quality_score": quality_score,
+                "policy_agent_id": self.policy.policy_id,
+            },
+            policy_version=self.policy.version,
+            batch_index=batch_index,
+        )
+    
     def _get_all_standings(self) -> Dict[str, float]:
         """Get all standings, using cache if valid."""
         if self._cache_valid and self._standings_cache is not None:
@@ -12,8 +12,10 @@ The `compile()` method transforms Policy -> Physics, ensuring constitutional inv
 from __future__ import annotations
 
 import copy
+import functools
 import hashlib
 import json
+import os
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
@@ -22,6 +24,12 @@ from typing import Any, Dict, List, Optional, Set, Literal
 import yaml
 from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 
+# Prefer the LibYAML-backed loader (same SafeLoader semantics, parsed in C)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
 
 def _canonical_json(data: Any) -> bytes:
     """Produce canonical JSON representation for hashing."""
@@ -213,10 +221,6 @@ class TrustPhysics(BaseModel):
         """Return the pre-computed physics hash."""
         return self.physics_hash
     
-    def get_initial_standing(self, role: str = "default") -> float:
-        """Get initial standing based on resolved probation rules."""
-        # Simple default logic for physics; FlowReducer uses more complex role logic if needed
-        # But for new agents, probation usually starts at 0 or low value
     def get_initial_standing(self, role: str = "default") -> float:
         """Get initial standing based on resolved probation rules."""
         return self.probation.initial_by_role.get(role, self.probation.initial_by_role.get("default", 0.0))
@@ -299,11 +303,73 @@ class FlowPolicy(BaseModel):
     def load(cls, path: str | Path) -> "FlowPolicy":
         path = Path(path)
         with open(path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         
         # Pre-processing to handle potential YAML structure quirks if needed
         return cls.model_validate(data)
 
+    @classmethod
+    def load_fast(cls, path: str | Path, cache_dir: str | Path) -> "FlowPolicy":
+        """
+        Load a policy, preferring a JSON cache of it when still valid.
+
+        The cache (`<cache_dir>/<stem>.cache.json`) records the sha256 of
+        the YAML it was built from and a fingerprint of the FlowPolicy
+        schema (fields and defaults). It is used only when both match, so
+        neither an edited YAML (whatever its mtime) nor a kaori-flow
+        upgrade can serve a stale policy. Otherwise the YAML is parsed and
+        the cache is rewritten atomically. The YAML stays the source of
+        truth; nothing is written next to it.
+
+        Args:
+            path: Path to the policy YAML
+            cache_dir: Directory for the JSON cache (created if missing)
+        """
+        path = Path(path)
+        cache_path = Path(cache_dir) / f"{path.stem}.cache.json"
+        raw = path.read_bytes()
+        source_sha256 = hashlib.sha256(raw).hexdigest()
+        schema_sha256 = _policy_schema_sha256()
+        
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            if (
+                cached["source_sha256"] == source_sha256
+                and cached["schema_sha256"] == schema_sha256
+            ):
+                return cls.model_validate(cached["policy"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing, stale or corrupt cache: fall back to YAML
+        
+        policy = cls.model_validate(yaml.load(raw, Loader=_YamlLoader))
+        policy.to_json_cache(cache_path, source_sha256)
+        return policy
+
+    def to_json_cache(self, path: str | Path, source_sha256: str) -> None:
+        """
+        Write this policy as a JSON cache file (atomic; best effort).
+
+        Only fields set in the source are written, so schema defaults are
+        re-applied on load rather than frozen into the cache.
+
+        Args:
+            path: Cache file path to write
+            source_sha256: sha256 hex digest of the YAML this policy was loaded from
+        """
+        path = Path(path)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        content = json.dumps({
+            "source_sha256": source_sha256,
+            "schema_sha256": _policy_schema_sha256(),
+            "policy": self.model_dump(mode='json', exclude_unset=True),
+        })
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(content, encoding='utf-8')
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)  # Read-only location: skip caching
+
     @classmethod
     def default(cls) -> "FlowPolicy":
         """Return a default development policy."""
@@ -483,3 +549,10 @@ class FlowPolicy(BaseModel):
                 self._deep_update(target[k], v)
             else:
                 target[k] = v
+
+
+@functools.cache
+def _policy_schema_sha256() -> str:
+    """Fingerprint of the FlowPolicy schema (fields and defaults) for cache keys."""
+    schema = FlowPolicy.model_json_schema()
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest()
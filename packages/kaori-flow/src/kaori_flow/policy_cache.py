@@ -0,0 +1,97 @@
+"""
+Kaori Flow — Policy Cache
+
+Process-level cache for FlowPolicy loading and Policy -> Physics compilation.
+
+This is the single cached loading path for policy files. Entries are keyed
+on (path, sha256 of the file content): mtimes are not trusted, since copies
+and restores can keep an older mtime on an edited file. Any edit therefore
+invalidates the entry on the next call without an explicit reset.
+
+Cold loads go through FlowPolicy.load, or FlowPolicy.load_fast when the
+caller passes a cache_dir (opt-in JSON cache across processes).
+
+- FlowPolicy is a mutable AST: callers receive a deep copy.
+- TrustPhysics is frozen and hashed: the compiled instance is shared.
+"""
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .flow_policy import FlowPolicy, TrustPhysics
+
+
+def _cache_key(path: str | Path) -> Tuple[str, str]:
+    """Resolve a policy path to its (path, content sha256) cache key."""
+    path = Path(path).resolve()
+    return str(path), hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _load_policy(
+    path_str: str,
+    source_sha256: str,
+    cache_dir: Optional[str],
+) -> FlowPolicy:
+    if cache_dir is None:
+        return FlowPolicy.load(path_str)
+    return FlowPolicy.load_fast(path_str, cache_dir)
+
+
+@lru_cache(maxsize=32)
+def _load_physics(
+    path_str: str,
+    source_sha256: str,
+    cache_dir: Optional[str],
+    override_profile: Optional[str],
+) -> TrustPhysics:
+    return _load_policy(path_str, source_sha256, cache_dir).compile(override_profile)
+
+
+def load_policy_cached(
+    path: str | Path,
+    cache_dir: Optional[str | Path] = None,
+) -> FlowPolicy:
+    """
+    Load a FlowPolicy, reusing the parsed result while the file is unchanged.
+
+    Args:
+        path: Path to the policy YAML
+        cache_dir: Optional directory for a cross-process JSON cache
+                   (see FlowPolicy.load_fast). Nothing is written without it.
+
+    Returns:
+        A private (deep) copy of the cached FlowPolicy
+    """
+    cache_dir = str(cache_dir) if cache_dir is not None else None
+    return _load_policy(*_cache_key(path), cache_dir).model_copy(deep=True)
+
+
+def load_physics_cached(
+    path: str | Path,
+    override_profile: Optional[str] = None,
+    cache_dir: Optional[str | Path] = None,
+) -> TrustPhysics:
+    """
+    Load and compile a policy file to TrustPhysics, cached per file content.
+
+    Args:
+        path: Path to the policy YAML
+        override_profile: Optional profile to compile instead of the default
+        cache_dir: Optional directory for a cross-process JSON cache
+                   (see FlowPolicy.load_fast). Nothing is written without it.
+
+    Returns:
+        The shared, frozen TrustPhysics
+    """
+    cache_dir = str(cache_dir) if cache_dir is not None else None
+    return _load_physics(*_cache_key(path), cache_dir, override_profile)
+
+
+def clear_policy_cache() -> None:
+    """Drop all cached policies and physics."""
+    _load_policy.cache_clear()
+    _load_physics.cache_clear()
@@ -7,6 +7,7 @@ Rule 3: Standing is the Primitive of Trust.
 """
 from __future__ import annotations
 
+from bisect import bisect_right
 from datetime import datetime
 from enum import Enum
 from typing import Optional
@@ -32,6 +33,16 @@ STANDING_MIN = 0.0
 STANDING_MAX = 1000.0
 STANDING_DEFAULT = 200.0
 
+# Standing class thresholds (0-1000 range): [0,300) bronze, [300,500) silver,
+# [500,700) expert, [700,1000] authority
+STANDING_CLASS_BREAKS = (300.0, 500.0, 700.0)
+STANDING_CLASS_NAMES = ("bronze", "silver", "expert", "authority")
+
+
+def derive_standing_class(standing: float) -> str:
+    """Derive standing class from a scalar standing value."""
+    return STANDING_CLASS_NAMES[bisect_right(STANDING_CLASS_BREAKS, standing)]
+
 
 class Agent(BaseModel):
     """
@@ -61,14 +72,7 @@ class Agent(BaseModel):
         Derive standing class from scalar value.
         Thresholds based on 0-1000 range.
         """
-        if self.standing < 300:
-            return "bronze"
-        elif self.standing < 500:
-            return "silver"
-        elif self.standing < 700:
-            return "expert"
-        else:
-            return "authority"
+        return derive_standing_class(self.standing)
     
     @property
     def is_high_assurance(self) -> bool:
@@ -56,6 +56,10 @@ class Signal(BaseModel):
     # Policy version
     policy_version: str = "1.0.0"
     
+    # Position within a batch emitted at one time (optional). Keeps
+    # identical events emitted together distinct; unset for single emits.
+    batch_index: Optional[int] = None
+    
     # Integrity (optional)
     signature: Optional[str] = None
     
@@ -72,7 +76,7 @@ class Signal(BaseModel):
     
     def canonical_dict(self) -> dict:
         """Get canonical representation for hashing (excludes signal_id and signature)."""
-        return {
+        canonical = {
             "signal_type": self.signal_type,
             "time": self.time.isoformat(),
             "agent_id": self.agent_id,
@@ -81,6 +85,10 @@ class Signal(BaseModel):
             "payload": self.payload,
             "policy_version": self.policy_version,
         }
+        # Only hashed when set, so unbatched signal ids are unchanged
+        if self.batch_index is not None:
+            canonical["batch_index"] = self.batch_index
+        return canonical
 
 
 # Common signal type constants
@@ -108,54 +108,45 @@ class FlowReducer:
         contributors = signal.payload.get("contributors", [])
         outcome = signal.payload.get("outcome", "unknown")
         quality_score = signal.payload.get("quality_score", 50.0)
+        policy_id = signal.payload.get("policy_agent_id")
+        
+        standings = state.standings
+        if not contributors and not (policy_id and policy_id in standings):
+            return  # Nothing to update: don't evaluate the deltas at all
+        
+        # Deltas depend only on (outcome, quality): compute once per signal
+        if outcome == "correct":
+            # Gain: ΔS = a * log(1 + q)
+            log_quality = math.log(1 + quality_score)
+            delta = self.policy.update.reward.get("correct", 3.0) * log_quality
+            policy_delta = 0.5 * log_quality  # Smaller gain for policy
+        elif outcome == "incorrect":
+            # Penalty: ΔS = -b * log(1 + q)
+            # Note: Physics doesn't allow 'amplifier' anymore, it's just raw coefficients in the map
+            # So we just use the coeff directly.
+            log_quality = math.log(1 + quality_score)
+            delta = self.policy.update.penalty.get("incorrect", -5.0) * log_quality
+            policy_delta = -1.0 * log_quality  # Larger penalty for policy
+        else:
+            delta = 0.0
+            policy_delta = 0.0
+        
+        # Bounds are in self.policy.bounds_range
+        bounds_min = self.policy.bounds_range.get("min", 0.0)
+        bounds_max = self.policy.bounds_range.get("max", 1000.0)
         
         for agent_id in contributors:
-            if agent_id not in state.standings:
-                state.standings[agent_id] = self.policy.get_initial_standing("observer")
-            
-            current = state.standings[agent_id]
-            
-            if outcome == "correct":
-                # Gain: ΔS = a * log(1 + q)
-                coeff = self.policy.update.reward.get("correct", 3.0)
-                delta = coeff * math.log(1 + quality_score)
-            elif outcome == "incorrect":
-                # Penalty: ΔS = -b * log(1 + q)
-                coeff = self.policy.update.penalty.get("incorrect", -5.0)
-                # Note: Physics doesn't allow 'amplifier' anymore, it's just raw coefficients in the map
-                # So we just use the coeff directly.
-                delta = coeff * math.log(1 + quality_score)
-            else:
-                delta = 0.0
+            if agent_id not in standings:
+                standings[agent_id] = self.policy.get_initial_standing("observer")
             
             # Apply delta and clamp to bounds
-            
-            # Bounds are in self.policy.bounds_range
-            bounds_min = self.policy.bounds_range.get("min", 0.0)
-            bounds_max = self.policy.bounds_range.get("max", 1000.0)
-            
-            new_standing = current + delta
-            new_standing = max(bounds_min, min(new_standing, bounds_max))
-            state.standings[agent_id] = new_standing
+            new_standing = standings[agent_id] + delta
+            standings[agent_id] = max(bounds_min, min(new_standing, bounds_max))
         
         # Update policy standing based on truth outcome quality
-        policy_id = signal.payload.get("policy_agent_id")
-        if policy_id and policy_id in state.standings:
-            current = state.standings[policy_id]
-            # Policy gains/loses based on overall truth quality
-            if outcome == "correct":
-                delta = 0.5 * math.log(1 + quality_score)  # Smaller gain for policy
-            elif outcome == "incorrect":
-                delta = -1.0 * math.log(1 + quality_score)  # Larger penalty for policy
-            else:
-                delta = 0.0
-            
-            bounds_min = self.policy.bounds_range.get("min", 0.0)
-            bounds_max = self.policy.bounds_range.get("max", 1000.0)
-            
-            new_standing = current + delta
-            new_standing = max(bounds_min, min(new_standing, bounds_max))
-            state.standings[policy_id] = new_standing
+        if policy_id and policy_id in standings:
+            new_standing = standings[policy_id] + policy_delta
+            standings[policy_id] = max(bounds_min, min(new_standing, bounds_max))
     
     def _handle_penalty(self, state: ReducerState, signal: Signal) -> None:
         """Apply explicit penalty to an agent."""
@@ -13,7 +13,7 @@ import json
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator, List, Optional, Protocol, runtime_checkable
+from typing import Iterable, Iterator, List, Optional, Protocol, runtime_checkable
 
 from .primitives.signal import Signal
 
@@ -27,12 +27,25 @@ class SignalStore(Protocol):
     - Append-only semantics (signals never modified or deleted)
     - Ordered replay by time
     - Indexing by agent_id for efficient queries
+    
+    Stores that subclass SignalStore inherit a default `extend()` that
+    appends one signal at a time; override it to write a batch at once.
     """
     
     def append(self, signal: Signal) -> None:
         """Append a signal to the store. Must be idempotent on signal_id."""
         ...
     
+    def extend(self, signals: Iterable[Signal]) -> None:
+        """
+        Append many signals, with the same semantics as append() per signal.
+        
+        Default implementation loops over append(); stores with a cheaper
+        batch write (one transaction, one file write) should override it.
+        """
+        for signal in signals:
+            self.append(signal)
+    
     def get_all(self) -> List[Signal]:
         """Get all signals, ordered by time."""
         ...
@@ -50,7 +63,7 @@ class SignalStore(Protocol):
         ...
 
 
-class InMemorySignalStore:
+class InMemorySignalStore(SignalStore):
     """
     In-memory signal store for testing and development.
     
@@ -60,6 +73,9 @@ class InMemorySignalStore:
     def __init__(self) -> None:
         self._signals: List[Signal] = []
         self._by_id: dict[str, Signal] = {}
+        # Secondary indexes (insertion order) for filtered reads
+        self._by_agent: dict[str, List[Signal]] = {}
+        self._by_type: dict[str, List[Signal]] = {}
     
     def append(self, signal: Signal) -> None:
         """Append signal. Idempotent on signal_id."""
@@ -67,6 +83,10 @@ class InMemorySignalStore:
             return  # Already exists, ignore (idempotent)
         self._signals.append(signal)
         self._by_id[signal.signal_id] = signal
+        self._by_agent.setdefault(signal.agent_id, []).append(signal)
+        if signal.object_id != signal.agent_id:
+            self._by_agent.setdefault(signal.object_id, []).append(signal)
+        self._by_type.setdefault(signal.signal_type, []).append(signal)
     
     def get_all(self) -> List[Signal]:
         """Get all signals, ordered by time."""
@@ -74,24 +94,18 @@ class InMemorySignalStore:
     
     def get_for_agent(self, agent_id: str) -> List[Signal]:
         """Get signals where agent_id matches emitter or object_id."""
-        return sorted(
-            [s for s in self._signals if s.agent_id == agent_id or s.object_id == agent_id],
-            key=lambda s: s.time
-        )
+        return sorted(self._by_agent.get(agent_id, []), key=lambda s: s.time)
     
     def get_since(self, since: datetime) -> List[Signal]:
         """Get signals since a given time."""
         return sorted(
-            [s for s in self._signals if s.time >= since],
+            (s for s in self._signals if s.time >= since),
             key=lambda s: s.time
         )
     
     def get_by_type(self, signal_type: str) -> List[Signal]:
         """Get signals of a specific type."""
-        return sorted(
-            [s for s in self._signals if s.signal_type == signal_type],
-            key=lambda s: s.time
-        )
+        return sorted(self._by_type.get(signal_type, []), key=lambda s: s.time)
     
     def __len__(self) -> int:
         return len(self._signals)
@@ -100,9 +114,11 @@ class InMemorySignalStore:
         """Clear all signals (for testing only)."""
         self._signals.clear()
         self._by_id.clear()
+        self._by_agent.clear()
+        self._by_type.clear()
 
 
-class JSONLSignalStore:
+class JSONLSignalStore(SignalStore):
     """
     JSONL file-based signal store for simple deployments.
     
@@ -127,28 +143,42 @@ class JSONLSignalStore:
         with open(self._path, 'a') as f:
             f.write(signal.model_dump_json() + '\n')
     
+    def extend(self, signals: Iterable[Signal]) -> None:
+        """Append many signals with a single dedup scan and file write."""
+        seen = {s.signal_id for s in self._iter_signals()}
+        lines = []
+        for signal in signals:
+            if signal.signal_id in seen:
+                continue
+            seen.add(signal.signal_id)
+            lines.append(signal.model_dump_json() + '\n')
+        
+        if lines:
+            with open(self._path, 'a') as f:
+                f.writelines(lines)
+    
     def get_all(self) -> List[Signal]:
         """Get all signals, ordered by time."""
-        return sorted(list(self._iter_signals()), key=lambda s: s.time)
+        return sorted(self._iter_signals(), key=lambda s: s.time)
     
     def get_for_agent(self, agent_id: str) -> List[Signal]:
         """Get signals where agent_id matches emitter or object_id."""
         return sorted(
-            [s for s in self._iter_signals() if s.agent_id == agent_id or s.object_id == agent_id],
+            (s for s in self._iter_signals() if s.agent_id == agent_id or s.object_id == agent_id),
             key=lambda s: s.time
         )
     
     def get_since(self, since: datetime) -> List[Signal]:
         """Get signals since a given time."""
         return sorted(
-            [s for s in self._iter_signals() if s.time >= since],
+            (s for s in self._iter_signals() if s.time >= since),
             key=lambda s: s.time
         )
     
     def get_by_type(self, signal_type: str) -> List[Signal]:
         """Get signals of a specific type."""
         return sorted(
-            [s for s in self._iter_signals() if s.signal_type == signal_type],
+            (s for s in self._iter_signals() if s.signal_type == signal_type),
             key=lambda s: s.time
         )
     
@@ -14,6 +14,7 @@ from typing import Dict, List, Optional, Tuple
 
 from kaori_truth.trust_snapshot import TrustSnapshot, AgentTrust
 from .flow_policy import TrustPhysics
+from .primitives.agent import derive_standing_class
 from .primitives.signal import Signal, SignalTypes
 
 
@@ -58,18 +59,31 @@ class TrustComputer:
         base_standing: float,
         context: TrustContext,
         signals: List[Signal],
+        endorsements: Optional[Dict[Tuple[str, str], datetime]] = None,
+        now: Optional[datetime] = None,
     ) -> float:
         """
         Compute effective trust for an agent in context.
         
         This implements Rule 4 (local topology) using modifiers from FlowPolicy.
+        
+        Args:
+            endorsements: Optional pre-built index from `index_endorsements`.
+                          Built from `signals` when not provided (and only
+                          if the context has collaborators to look up).
+            now: Reference time for edge decay. Defaults to current UTC.
         """
+        if endorsements is None:
+            endorsements = self._endorsements_for(context, signals)
+        if now is None:
+            now = datetime.now(timezone.utc)
+        
         # Step 1: Apply saturation curve (Rule 5)
         base_effective = self._apply_saturation(base_standing)
         
         # Step 2: Network bonuses (from policy configuration)
         network_bonus = self._compute_network_bonus(
-            agent_id, base_effective, context, signals
+            agent_id, base_effective, context, endorsements, now
         )
         
         # Step 3: Probe creator bonus
@@ -106,7 +120,8 @@ class TrustComputer:
         agent_id: str,
         base_effective: float,
         context: TrustContext,
-        signals: List[Signal],
+        endorsements: Dict[Tuple[str, str], datetime],
+        now: datetime,
     ) -> float:
         """
         Compute network bonus from claimtype collaborators (Rule 4).
@@ -120,7 +135,7 @@ class TrustComputer:
         for collab_id, collab_standing in context.claimtype_collaborators:
             # Check if collaborator vouched for this agent
             edge_weight = self._compute_vouch_edge_weight(
-                collab_id, agent_id, signals
+                collab_id, agent_id, endorsements, now
             )
             
             if edge_weight > 0:
@@ -130,11 +145,47 @@ class TrustComputer:
         max_bonus = config.max_bonus_fraction * base_effective
         return min(bonus, max_bonus)
     
+    @staticmethod
+    def index_endorsements(
+        signals: List[Signal],
+    ) -> Dict[Tuple[str, str], datetime]:
+        """
+        Index ENDORSEMENT signals by (voucher_id, vouchee_id).
+        
+        Maps each VOUCH edge to its most recent endorsement time, so edge
+        lookups are O(1) instead of a scan over the full signal history.
+        """
+        latest: Dict[Tuple[str, str], datetime] = {}
+        for s in signals:
+            if s.signal_type != SignalTypes.ENDORSEMENT:
+                continue
+            key = (s.agent_id, s.object_id)
+            if key not in latest or s.time > latest[key]:
+                latest[key] = s.time
+        return latest
+    
+    def _endorsements_for(
+        self,
+        context: TrustContext,
+        signals: List[Signal],
+    ) -> Dict[Tuple[str, str], datetime]:
+        """
+        Index VOUCH edges only when the network bonus will look them up.
+        
+        Without claimtype collaborators (or with the modifier disabled) no
+        edge is queried, so the signal history is not scanned.
+        """
+        config = self.policy.network_modifiers.claimtype_collaborator_vouch
+        if not config.enabled or not context.claimtype_collaborators:
+            return {}
+        return self.index_endorsements(signals)
+    
     def _compute_vouch_edge_weight(
         self,
         voucher_id: str,
         vouchee_id: str,
-        signals: List[Signal],
+        endorsements: Dict[Tuple[str, str], datetime],
+        now: datetime,
     ) -> float:
         """
         Compute edge weight for VOUCH relationship.
@@ -143,23 +194,13 @@ class TrustComputer:
         """
         config = self.policy.edge_weights.vouch
         
-        # Find endorsement signals
-        endorsements = [
-            s for s in signals
-            if s.signal_type == SignalTypes.ENDORSEMENT
-            and s.agent_id == voucher_id
-            and s.object_id == vouchee_id
-        ]
-        
-        if not endorsements:
-            return 0.0
-        
         # Use most recent endorsement
-        latest = max(endorsements, key=lambda s: s.time)
+        latest_time = endorsements.get((voucher_id, vouchee_id))
+        if latest_time is None:
+            return 0.0
         
         # Weight decays over time
-        now = datetime.now(timezone.utc)
-        age_days = (now - latest.time).total_seconds() / 86400
+        age_days = (now - latest_time).total_seconds() / 86400
         
         weight = config.base_weight * math.exp(-config.decay_rate_per_day * age_days)
         return max(0.0, weight)
@@ -247,9 +288,15 @@ class TrustComputer:
         
         agent_trusts = {}
         
+        # Materialize VOUCH edges once for all agents in the snapshot
+        endorsements = self._endorsements_for(context, signals)
+        
+        # Sample the clock once so every agent decays against the same instant
+        now = datetime.now(timezone.utc)
+        
         for agent_id, standing in agent_standings.items():
             effective = self.compute_effective_trust(
-                agent_id, standing, context, signals
+                agent_id, standing, context, signals, endorsements, now
             )
             
             # Derive class from standing
@@ -270,7 +317,7 @@ class TrustComputer:
         
         snapshot = TrustSnapshot(
             snapshot_id=str(uuid.uuid4()),
-            snapshot_time=context.snapshot_time or datetime.now(timezone.utc),
+            snapshot_time=context.snapshot_time or now,
             agent_trusts=agent_trusts,
             snapshot_hash="",
         )
@@ -280,11 +327,4 @@ class TrustComputer:
     
     def _derive_class(self, standing: float) -> str:
         """Derive standing class from value."""
-        if standing < 300:
-            return "bronze"
-        elif standing < 500:
-            return "silver"
-        elif standing < 700:
-            return "expert"
-        else:
-            return "authority"
+        return derive_standing_class(standing)
@@ -13,6 +13,8 @@ from kaori_flow import (
     SignalTypes,
     TrustContext,
     InMemorySignalStore,
+    JSONLSignalStore,
+    SignalStore,
     Agent,
     AgentType,
     STANDING_MIN,
@@ -59,6 +61,37 @@ class TestFlowCore:
         
         standing = flow.get_standing("official:gov")
         assert standing == 500.0  # Default for authority
+    
+    def test_submit_observations_batch(self):
+        """Batch submission stores one signal per item, identical items included."""
+        flow = FlowCore()
+        observation = {"observer_id": "user:alice", "probe_id": "probe:1", "payload": {"v": 1}}
+        
+        signals = flow.submit_observations([observation, dict(observation)])
+        
+        assert len(signals) == 2
+        assert len(flow.store) == 2
+        assert signals[0].time == signals[1].time  # One real emission time
+        assert [s.batch_index for s in signals] == [0, 1]
+        assert signals[0].signal_id != signals[1].signal_id
+    
+    def test_emit_many_default_extend(self):
+        """Stores without a batch write get SignalStore.extend (append per signal)."""
+        class AppendOnlyStore(SignalStore):
+            def __init__(self):
+                self.appended = []
+            
+            def append(self, signal):
+                self.appended.append(signal)
+        
+        store = AppendOnlyStore()
+        flow = FlowCore(store=store)
+        signals = flow.submit_observations([
+            {"observer_id": "user:alice", "probe_id": "probe:1", "payload": {}},
+            {"observer_id": "user:bob", "probe_id": "probe:1", "payload": {}},
+        ])
+        
+        assert store.appended == signals
 
 
 class TestStandingUpdates:
@@ -156,6 +189,80 @@ class TestStandingUpdates:
         standing = flow.get_standing("user:test")
         assert standing >= STANDING_MIN
         assert standing <= STANDING_MAX
+    
+    def test_batch_matches_sequential(self):
+        """emit_truthstates yields the same standing as per-item emission."""
+        outcomes = ["correct", "incorrect", "correct"]
+        
+        sequential = FlowCore()
+        sequential.register_agent("user:test")
+        for i, outcome in enumerate(outcomes):
+            sequential.emit_truthstate(
+                truthkey=f"test:key:{i}",
+                status="VERIFIED_TRUE",
+                confidence=0.9,
+                contributors=["user:test"],
+                outcome=outcome,
+            )
+        
+        batched = FlowCore()
+        batched.register_agent("user:test")
+        signals = batched.emit_truthstates([
+            {
+                "truthkey": f"test:key:{i}",
+                "status": "VERIFIED_TRUE",
+                "confidence": 0.9,
+                "contributors": ["user:test"],
+                "outcome": outcome,
+            }
+            for i, outcome in enumerate(outcomes)
+        ])
+        
+        assert len(signals) == 3
+        assert batched.get_standing("user:test") == pytest.approx(
+            sequential.get_standing("user:test")
+        )
+    
+    def test_batch_identical_items_match_sequential(self):
+        """Identical batched truth states each count, as with per-item emission."""
+        truthstate = {
+            "truthkey": "test:key:same",
+            "status": "VERIFIED_TRUE",
+            "confidence": 0.9,
+            "contributors": ["user:test"],
+        }
+        
+        sequential = FlowCore()
+        sequential.register_agent("user:test")
+        for _ in range(3):
+            sequential.emit_truthstate(**truthstate)
+        
+        batched = FlowCore()
+        batched.register_agent("user:test")
+        signals = batched.emit_truthstates([dict(truthstate) for _ in range(3)])
+        
+        assert len(signals) == 3
+        assert len(batched.store) == len(sequential.store)
+        assert len({s.time for s in signals}) == 1
+        assert batched.get_standing("user:test") == pytest.approx(
+            sequential.get_standing("user:test")
+        )
+    
+    def test_no_op_truthstate_skips_delta(self):
+        """A truth state with nobody to update never evaluates log(1 + q)."""
+        flow = FlowCore()
+        flow.register_agent("user:test")
+        before = flow.get_standing("user:test")
+        
+        flow.emit(Signal(
+            signal_type=SignalTypes.TRUTHSTATE_EMITTED,
+            time=datetime.now(timezone.utc),
+            agent_id="system:truth",
+            object_id="test:key:empty",
+            payload={"contributors": [], "outcome": "correct", "quality_score": -1.0},
+        ))
+        
+        assert flow.get_standing("user:test") == before
 
 
 class TestTrustContext:
@@ -198,6 +305,48 @@ class TestTrustContext:
         
         assert self_trust < normal_trust
 
+    def test_collaborator_vouch_bonus(self):
+        """Endorsement from a claimtype collaborator boosts effective trust."""
+        flow = FlowCore()
+        flow.register_agent("user:voucher", role="authority")
+        flow.register_agent("user:vouchee", role="authority")
+
+        context = TrustContext(claimtype_collaborators=[("user:voucher", 500.0)])
+        before = flow.get_trust_snapshot(["user:vouchee"], context)
+
+        flow.endorse("user:voucher", "user:vouchee")
+        after = flow.get_trust_snapshot(["user:vouchee"], context)
+
+        assert (
+            after.agent_trusts["user:vouchee"].effective_trust
+            > before.agent_trusts["user:vouchee"].effective_trust
+        )
+
+
+class TestStandingClass:
+    """Tests for standing -> class derivation."""
+    
+    def test_class_boundaries(self):
+        """Thresholds are lower-inclusive and agree with Agent.derived_class."""
+        from kaori_flow.primitives.agent import derive_standing_class
+        
+        expected = {
+            0.0: "bronze",
+            299.9: "bronze",
+            300.0: "silver",
+            499.9: "silver",
+            500.0: "expert",
+            700.0: "authority",
+            1000.0: "authority",
+        }
+        for standing, cls in expected.items():
+            assert derive_standing_class(standing) == cls
+            assert Agent(
+                agent_id="user:test",
+                agent_type=AgentType.INDIVIDUAL,
+                standing=standing,
+            ).derived_class == cls
+
 
 class TestPolicyAsAgent:
     """Tests for Rule 7: Policy is an Agent."""
@@ -282,6 +431,20 @@ class TestSignal:
         )
         
         assert signal1.signal_id == signal2.signal_id
+    
+    def test_batch_index_distinguishes_id(self):
+        """batch_index is hashed only when set."""
+        fields = dict(
+            signal_type=SignalTypes.OBSERVATION_SUBMITTED,
+            time=datetime(2026, 1, 9, 12, 0, 0),
+            agent_id="user:test",
+            object_id="probe:1",
+        )
+        
+        unbatched = Signal(**fields)
+        assert "batch_index" not in unbatched.canonical_dict()
+        assert Signal(**fields, batch_index=0).signal_id != unbatched.signal_id
+        assert Signal(**fields, batch_index=0).signal_id != Signal(**fields, batch_index=1).signal_id
 
 
 class TestReplay:
@@ -384,3 +547,61 @@ class TestInMemoryStore:
         alice_signals = store.get_for_agent("user:alice")
         assert len(alice_signals) == 1
         assert alice_signals[0].agent_id == "user:alice"
+    
+    def test_indexed_filters(self):
+        """Agent and type filters match each signal once."""
+        store = InMemorySignalStore()
+        now = datetime.now(timezone.utc)
+        
+        store.append(Signal(
+            signal_type=SignalTypes.OBSERVATION_SUBMITTED,
+            time=now,
+            agent_id="user:alice",
+            object_id="user:alice",  # Emitter is also the object
+            payload={},
+        ))
+        store.append(Signal(
+            signal_type=SignalTypes.ENDORSEMENT,
+            time=now + timedelta(seconds=1),
+            agent_id="user:bob",
+            object_id="user:alice",
+            payload={},
+        ))
+        
+        alice_signals = store.get_for_agent("user:alice")
+        assert len(alice_signals) == 2
+        assert alice_signals[0].signal_type == SignalTypes.OBSERVATION_SUBMITTED
+        assert len(store.get_for_agent("user:bob")) == 1
+        assert len(store.get_by_type(SignalTypes.ENDORSEMENT)) == 1
+        
+        store.clear()
+        assert store.get_for_agent("user:alice") == []
+
+
+class TestJSONLStore:
+    """Tests for JSONLSignalStore."""
+
+    def test_extend_matches_append(self, tmp_path):
+        """Batch extend writes the same signals as per-signal append."""
+        signals = [
+            Signal(
+                signal_type=SignalTypes.OBSERVATION_SUBMITTED,
+                time=datetime(2026, 1, 9, 12, i, tzinfo=timezone.utc),
+                agent_id="user:test",
+                object_id=f"probe:{i}",
+                payload={},
+            )
+            for i in range(3)
+        ]
+
+        appended = JSONLSignalStore(tmp_path / "append.jsonl")
+        for signal in signals:
+            appended.append(signal)
+
+        extended = JSONLSignalStore(tmp_path / "extend.jsonl")
+        extended.extend(signals[:2])
+        extended.extend(signals)  # Overlapping batch
+
+        assert [s.signal_id for s in extended.get_all()] == [
+            s.signal_id for s in appended.get_all()
+        ]
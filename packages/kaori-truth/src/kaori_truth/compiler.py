@@ -108,20 +108,19 @@ def compile_truth_state(
     # 2. Gather compile inputs
     # =========================================================================
     
-    observation_ids = sorted([str(obs.observation_id) for obs in observations])
-    evidence_refs = []
-    for obs in observations:
-        for ref in obs.evidence_refs:
-            if hasattr(ref, 'uri'):
-                evidence_refs.append(ref.uri)
-            else:
-                evidence_refs.append(str(ref))
-    evidence_refs = sorted(set(evidence_refs))
+    observation_ids = sorted(str(obs.observation_id) for obs in observations)
+    # Observation.evidence_refs is validated as List[EvidenceRef]
+    evidence_refs = sorted({
+        ref.uri for obs in observations for ref in obs.evidence_refs
+    })
+    
+    # Hashed once per compile; reused in the TruthState below
+    claim_type_hash = claim_type.hash()
     
     compile_inputs = CompileInputs(
         observation_ids=observation_ids,
         claim_type_id=claim_type.id,
-        claim_type_hash=claim_type.hash(),
+        claim_type_hash=claim_type_hash,
         policy_version=policy_version,
         compiler_version=compiler_version,
         trust_snapshot_hash=trust_snapshot.snapshot_hash,
@@ -201,7 +200,7 @@ def compile_truth_state(
     truth_state = TruthState(
         truthkey=truth_key,
         claim_type=claim_type.id,
-        claim_type_hash=claim_type.hash(),
+        claim_type_hash=claim_type_hash,
         status=status,
         verification_basis=verification_basis,
         claim=validated_payload,  # Schema-validated and canonicalized
@@ -253,11 +252,13 @@ def _compute_observation_aggregate(
             "ai_variance": 0.0,
         }
     
-    # Sum of reporter powers from trust snapshot
+    # Sum of reporter powers from trust snapshot. Keep the explicit loop:
+    # builtin sum() over floats is compensated on Python 3.12+, which would
+    # make network_trust (and the semantic hash) depend on the interpreter.
+    get_trust = trust_snapshot.get_trust
     network_trust = 0.0
     for obs in observations:
-        power = trust_snapshot.get_trust(obs.reporter_id)
-        network_trust += power
+        network_trust += get_trust(obs.reporter_id)
     
     # AI scores
     if not ai_scores:
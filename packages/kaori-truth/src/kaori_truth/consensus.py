@@ -5,6 +5,7 @@ Compute consensus from votes using weighted threshold model (SPEC Section 10).
 """
 from __future__ import annotations
 
+import math
 from typing import Dict, List, Optional
 
 from kaori_truth.primitives.truthstate import ConsensusRecord
@@ -26,8 +27,6 @@ def compute_consensus(
     Returns:
         ConsensusRecord with computed score and finalization status
     """
-    import math
-    
     consensus_config = claim_config.get("consensus_model", {})
     finalize_threshold = consensus_config.get("finalize_threshold", 15)
     reject_threshold = consensus_config.get("reject_threshold", -10)
@@ -14,11 +14,17 @@ import yaml
 from pathlib import Path
 from typing import Any, Dict
 
+# Prefer the LibYAML-backed loader (same SafeLoader semantics, parsed in C)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
 def load_yaml_file(path: str | Path) -> Dict[str, Any]:
     """Load raw YAML file."""
     p = Path(path)
     with open(p, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 def load_json_file(path: str | Path) -> Dict[str, Any]:
     """Load raw JSON file."""
@@ -66,7 +66,7 @@ class EvidenceRef(BaseModel):
     @classmethod
     def from_content(
         cls,
-        content: bytes,
+        content: bytes | bytearray | memoryview,
         uri: str,
         *,
         mime_type: Optional[str] = None,
@@ -75,10 +75,12 @@ class EvidenceRef(BaseModel):
         """
         Create EvidenceRef from content bytes.
         
-        Computes SHA256 hash from content.
+        Computes SHA256 hash from content. Any bytes-like buffer is
+        accepted, so one file read can be shared across observations as
+        memoryview slices without copying.
         
         Args:
-            content: The evidence content bytes
+            content: The evidence content (bytes or bytes-like buffer)
             uri: Where the content is/will be stored
             mime_type: MIME type of the content
             capture_time: When the evidence was captured
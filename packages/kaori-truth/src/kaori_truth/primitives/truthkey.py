@@ -9,6 +9,7 @@ from __future__ import annotations
 import re
 from datetime import datetime
 from enum import Enum
+from functools import cache
 from typing import NamedTuple, Optional
 
 from pydantic import BaseModel, Field, field_validator
@@ -256,25 +257,43 @@ def build_truthkey(
     return canonical_truthkey(key_parts)
 
 
-def _compute_h3_index(lat: float, lon: float, resolution: int) -> str:
-    """Compute H3 index for lat/lon."""
+@cache
+def _load_h3():
+    """Import the optional h3 backend once (None if not installed)."""
     try:
         import h3
-        return h3.latlng_to_cell(lat, lon, resolution)
     except ImportError:
-        return f"mock_h3_{resolution}_{lat:.3f}_{lon:.3f}"
+        return None
+    return h3
 
 
-def _compute_healpix_index(ra: float, dec: float, nside: int = 4096) -> str:
-    """Compute HEALPix index for RA/Dec."""
+@cache
+def _load_healpix(nside: int):
+    """Build the optional HEALPix grid once per nside (None if not installed)."""
     try:
         from astropy_healpix import HEALPix
         import astropy.units as u
-        hp = HEALPix(nside=nside, order='ring')
-        pixel = hp.lonlat_to_healpix(ra * u.deg, dec * u.deg)
-        return str(pixel)
     except ImportError:
+        return None
+    return HEALPix(nside=nside, order='ring'), u
+
+
+def _compute_h3_index(lat: float, lon: float, resolution: int) -> str:
+    """Compute H3 index for lat/lon."""
+    h3 = _load_h3()
+    if h3 is None:
+        return f"mock_h3_{resolution}_{lat:.3f}_{lon:.3f}"
+    return h3.latlng_to_cell(lat, lon, resolution)
+
+
+def _compute_healpix_index(ra: float, dec: float, nside: int = 4096) -> str:
+    """Compute HEALPix index for RA/Dec."""
+    backend = _load_healpix(nside)
+    if backend is None:
         return f"mock_healpix_{nside}_{ra:.3f}_{dec:.3f}"
+    hp, u = backend
+    pixel = hp.lonlat_to_healpix(ra * u.deg, dec * u.deg)
+    return str(pixel)
 
 
 def _compute_meta_id(
@@ -6,6 +6,7 @@ Parse various datetime formats to timezone-aware UTC.
 from __future__ import annotations
 
 import re
+import sys
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
@@ -24,6 +25,15 @@ ISO8601_PATTERNS = [
 ]
 
 
+# fromisoformat() accepts a trailing 'Z' on datetimes from Python 3.11
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Fallback patterns for parse_iso8601 (compiled once)
+_ISO_MICRO_Z = re.compile(r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})\.(\d+)Z$')
+_ISO_SECONDS_Z = re.compile(r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})Z$')
+_ISO_MINUTES_Z = re.compile(r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2})Z$')
+
+
 def parse_timezone_offset(offset_str: str) -> timezone:
     """
     Parse a timezone offset string.
@@ -78,20 +88,22 @@ def parse_iso8601(s: str) -> datetime:
     
     # Try Python's fromisoformat (Python 3.11+)
     try:
-        # Handle Z suffix
-        if s.endswith('Z'):
-            s_modified = s[:-1] + '+00:00'
-            dt = datetime.fromisoformat(s_modified)
-            return dt.astimezone(timezone.utc)
-        else:
-            dt = datetime.fromisoformat(s)
-            return dt.astimezone(timezone.utc)
+        if _FROMISOFORMAT_ACCEPTS_Z or not s.endswith('Z'):
+            try:
+                return datetime.fromisoformat(s).astimezone(timezone.utc)
+            except ValueError:
+                if not s.endswith('Z'):
+                    raise
+        # Handle Z suffix: pre-3.11 fromisoformat rejects it, and 3.11+
+        # still does on date-only / week-date strings ("2026-01-07Z")
+        dt = datetime.fromisoformat(s[:-1] + '+00:00')
+        return dt.astimezone(timezone.utc)
     except ValueError:
         pass
     
     # Manual parsing for edge cases
     # With microseconds and Z
-    match = re.match(r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})\.(\d+)Z$', s)
+    match = _ISO_MICRO_Z.match(s)
     if match:
         year, month, day, hour, minute, second, micro = match.groups()
         # Pad/truncate microseconds to 6 digits
@@ -103,7 +115,7 @@ def parse_iso8601(s: str) -> datetime:
         )
     
     # With seconds and Z
-    match = re.match(r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})Z$', s)
+    match = _ISO_SECONDS_Z.match(s)
     if match:
         year, month, day, hour, minute, second = match.groups()
         return datetime(
@@ -113,7 +125,7 @@ def parse_iso8601(s: str) -> datetime:
         )
     
     # Minute precision with Z
-    match = re.match(r'^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2})Z$', s)
+    match = _ISO_MINUTES_Z.match(s)
     if match:
         year, month, day, hour, minute = match.groups()
         return datetime(
@@ -33,6 +33,7 @@ from kaori_truth.canonical.uri import (
     normalize_evidence_ref,
     canonical_evidence_hash,
 )
+from kaori_truth.primitives.evidence import EvidenceRef
 
 
 class TestCanonicalJSON:
@@ -193,6 +194,17 @@ class TestURICanonicalization:
         """Evidence hashes MUST be lowercase."""
         result = canonical_evidence_hash("ABCD" + "0" * 60)
         assert result == "abcd" + "0" * 60
+    
+    def test_evidence_ref_from_shared_view(self):
+        """EvidenceRef from a memoryview matches the same bytes."""
+        content = b"\x89PNG" + bytes(range(256))
+        
+        from_bytes = EvidenceRef.from_content(content, "gs://bucket/a.png")
+        from_view = EvidenceRef.from_content(memoryview(content), "gs://bucket/a.png")
+        
+        assert from_view.sha256 == from_bytes.sha256
+        assert from_view.bytes_size == len(content)
+        assert from_view.hash() == from_bytes.hash()
 
 
 class TestCanonicalID:
@@ -170,6 +170,17 @@ class TestDatetimeParsing:
         assert is_utc(result)
         assert result.microsecond == 123456
 
+    def test_z_suffix_matches_utc_offset(self):
+        """Z suffix should parse identically to an explicit +00:00 offset."""
+        for base in (
+            "2026-01-07",
+            "2026-W02-3",
+            "2026-01-07T12:00",
+            "2026-01-07T12:00:00",
+            "2026-01-07T12:00:00.123456",
+        ):
+            assert parse_datetime(base + "Z") == parse_datetime(base + "+00:00")
+
 
 class TestLocalTimeDifference:
     """Tests that same local time in different timezones bucket correctly."""
@@ -1,10 +1,18 @@
 """
 Tests for FlowPolicy and TrustPhysics Compilation.
 """
+import json
+import os
+from datetime import datetime
+
 import pytest
 import yaml
-from datetime import datetime
 from kaori_flow.flow_policy import FlowPolicy, TrustPhysics
+from kaori_flow.policy_cache import (
+    clear_policy_cache,
+    load_physics_cached,
+    load_policy_cached,
+)
 
 # Minimal Valid Policy Fixture
 SIMPLE_POLICY_YAML = """
@@ -129,3 +137,73 @@ def test_golden_hash(simple_policy_path):
     physics_3 = policy.compile("STANDARD")
     assert physics_3.physics_hash != physics.physics_hash
 
+
+def test_policy_cache_keyed_on_content(simple_policy_path, tmp_path):
+    """Test 5: Cached load reuses physics until the file content changes."""
+    clear_policy_cache()
+    
+    # Policy AST is mutable: each caller gets its own copy
+    policy_1 = load_policy_cached(simple_policy_path)
+    policy_2 = load_policy_cached(simple_policy_path)
+    assert policy_1 == policy_2
+    assert policy_1 is not policy_2
+    
+    # Physics is frozen: shared while the file is unchanged
+    physics_1 = load_physics_cached(simple_policy_path)
+    assert load_physics_cached(simple_policy_path) is physics_1
+    assert physics_1.physics_hash == FlowPolicy.load(simple_policy_path).compile().physics_hash
+    
+    # Nothing is written unless a cache_dir is passed
+    assert list(simple_policy_path.parent.iterdir()) == [simple_policy_path]
+    
+    # Editing the file invalidates the entry, even with an OLDER mtime
+    stat = simple_policy_path.stat()
+    simple_policy_path.write_text(
+        SIMPLE_POLICY_YAML.replace("correct: 5", "correct: 7"), encoding='utf-8'
+    )
+    os.utime(simple_policy_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+    
+    physics_2 = load_physics_cached(simple_policy_path)
+    assert physics_2.physics_hash != physics_1.physics_hash
+    assert physics_2.update.reward['correct'] == 7
+    
+    # Opt-in cross-process cache goes to the given directory
+    clear_policy_cache()
+    physics_3 = load_physics_cached(simple_policy_path, cache_dir=tmp_path / "cache")
+    assert physics_3.physics_hash == physics_2.physics_hash
+    assert (tmp_path / "cache" / f"{simple_policy_path.stem}.cache.json").exists()
+
+def test_load_fast_json_sidecar(simple_policy_path, tmp_path):
+    """Test 6: JSON cache round-trips to identical physics."""
+    cache_dir = tmp_path / "cache"
+    cache_file = cache_dir / f"{simple_policy_path.stem}.cache.json"
+    expected = FlowPolicy.load(simple_policy_path).compile().physics_hash
+    
+    # Cold: parses YAML and writes the cache (never next to the YAML)
+    assert FlowPolicy.load_fast(simple_policy_path, cache_dir).compile().physics_hash == expected
+    assert cache_file.exists()
+    assert not simple_policy_path.with_suffix('.cache.json').exists()
+    
+    # Warm: served from the cache; schema defaults are not frozen into it
+    cached = json.loads(cache_file.read_text(encoding='utf-8'))
+    assert "initialization" not in cached["policy"]["standing_dynamics"]
+    assert FlowPolicy.load_fast(simple_policy_path, cache_dir).compile().physics_hash == expected
+    
+    # Cache written by a different FlowPolicy schema is ignored and rewritten
+    cached["schema_sha256"] = "0" * 64
+    cached["policy"]["version"] = "9.9.9"
+    cache_file.write_text(json.dumps(cached), encoding='utf-8')
+    assert FlowPolicy.load_fast(simple_policy_path, cache_dir).version == "1.0.0"
+    
+    # YAML edited but with an OLDER mtime (cp -p, rsync -t, restore):
+    # the content hash no longer matches, so the cache is rewritten
+    simple_policy_path.write_text(
+        SIMPLE_POLICY_YAML.replace("correct: 5", "correct: 7"), encoding='utf-8'
+    )
+    stat = cache_file.stat()
+    os.utime(simple_policy_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 1_000_000_000))
+    
+    reloaded = FlowPolicy.load_fast(simple_policy_path, cache_dir)
+    assert reloaded.standing_dynamics.update.reward['correct'] == 7
+    assert reloaded.compile().physics_hash == FlowPolicy.load(simple_policy_path).compile().physics_hash
+    assert FlowPolicy.load_fast(simple_policy_path, cache_dir).standing_dynamics.update.reward['correct'] == 7
@@ -8,6 +8,13 @@ from pathlib import Path
 import yaml
 from jsonschema import Draft202012Validator
 
+# Same loader selection as kaori_truth.io.loaders (kept local: CI runs this
+# tool with only pyyaml + jsonschema installed)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _YamlLoader
+
 
 ROOT = Path(__file__).resolve().parents[1]
 # Updated paths for monorepo structure
@@ -33,7 +40,7 @@ def gather_claim_files():
 
 def load_yaml(path: Path):
     try:
-        return yaml.safe_load(path.read_text(encoding="utf-8"))
+        return yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
     except Exception as e:
         raise RuntimeError(f"Failed to parse YAML {path}: {e}")
 